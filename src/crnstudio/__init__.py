@@ -1,6 +1,21 @@
 """CRNStudio public API."""
 
-from .model import RateLaw, Reaction, Species, mass_action
-from .simulation import DeterministicSimulator
+from .model import MassActionLaw, RateLaw, Reaction, Species, mass_action
+from .simulation import (
+    AdaptiveDP45Simulator,
+    DeterministicSimulator,
+    ImplicitSimulator,
+    SimulationResult,
+)
 
-__all__ = ["RateLaw", "Reaction", "Species", "mass_action", "DeterministicSimulator"]
+__all__ = [
+    "MassActionLaw",
+    "RateLaw",
+    "Reaction",
+    "Species",
+    "mass_action",
+    "AdaptiveDP45Simulator",
+    "DeterministicSimulator",
+    "ImplicitSimulator",
+    "SimulationResult",
+]
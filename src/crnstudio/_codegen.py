@@ -0,0 +1,98 @@
+"""Runtime generation of straight-line RHS functions for mass-action networks.
+
+The generated ``_rhs(t, x, out)`` inlines every rate constant, exponent and
+stoichiometric coefficient as a literal, replacing the generic per-reaction
+evaluation with plain arithmetic specialized to one network. The source is run as
+plain Python: JIT-compiling it would cost a fresh, uncacheable compile for every
+network and every new set of rate constants.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._kernels import CSRArrays
+from .model import _INTEGER_EXPONENTS
+
+RHSFunction = Callable[[float, NDArray[np.float64], NDArray[np.float64]], None]
+
+# Straight-line Python beats the vectorized NumPy RHS only for small networks.
+MAX_PYTHON_TERMS = 256
+
+
+def _rate_expression(j: int, k_const: NDArray[np.float64], L: CSRArrays) -> str:
+    indptr, indices, data = L
+    factors = [repr(float(k_const[j]))]
+    for k in range(indptr[j], indptr[j + 1]):
+        i, exponent = int(indices[k]), float(data[k])
+        if exponent in _INTEGER_EXPONENTS:
+            factors.extend([f"x{i}"] * int(exponent))
+        else:
+            factors.append(f"x{i} ** {exponent!r}")
+    return " * ".join(factors)
+
+
+def _change_expression(i: int, S: CSRArrays) -> str:
+    indptr, indices, data = S
+    expr = ""
+    for k in range(indptr[i], indptr[i + 1]):
+        j, coeff = int(indices[k]), float(data[k])
+        sign = "-" if coeff < 0 else "+"
+        term = f"r{j}" if abs(coeff) == 1.0 else f"{abs(coeff)!r} * r{j}"
+        if not expr:
+            expr = term if sign == "+" else f"-{term}"
+        else:
+            expr += f" {sign} {term}"
+    return expr or "0.0"
+
+
+def rhs_source(S: CSRArrays, k_const: NDArray[np.float64], L: CSRArrays) -> str:
+    """Generate Python source for a network's ``_rhs(t, x, out)`` function.
+
+    Args:
+        S: Stoichiometry as a CSR triple of shape ``(n_species, n_reactions)``.
+        k_const: Rate constants of shape ``(n_reactions,)``.
+        L: Reactant exponents as a CSR triple of shape ``(n_reactions, n_species)``.
+
+    Returns:
+        Source code defining ``_rhs``.
+
+    """
+    n_species = len(S[0]) - 1
+    lines = ["def _rhs(t, x, out):"]
+    # Unpacking through tolist() keeps the arithmetic on Python floats.
+    lines.append("    " + "".join(f"x{i}, " for i in range(n_species)) + "= x.tolist()")
+    lines.extend(f"    r{j} = {_rate_expression(j, k_const, L)}" for j in range(len(k_const)))
+    lines.extend(f"    out[{i}] = {_change_expression(i, S)}" for i in range(n_species))
+    return "\n".join(lines) + "\n"
+
+
+def compile_rhs(S: CSRArrays, k_const: NDArray[np.float64], L: CSRArrays) -> Optional[RHSFunction]:
+    """Generate and execute a network's RHS.
+
+    Args:
+        S: Stoichiometry as a CSR triple of shape ``(n_species, n_reactions)``.
+        k_const: Rate constants of shape ``(n_reactions,)``.
+        L: Reactant exponents as a CSR triple of shape ``(n_reactions, n_species)``.
+
+    Returns:
+        Function writing ``dC/dt`` at ``(t, x)`` into ``out``, or None if the network
+        is too large for generated code to pay off or needs NumPy float semantics.
+
+    """
+    if len(S[2]) + len(L[2]) > MAX_PYTHON_TERMS:
+        return None
+    # Python floats differ from NumPy for fractional powers of negative values (complex),
+    # overflowing pow() (OverflowError) and non-finite literals (``inf`` is not a name).
+    # Leave those networks to the vectorized path.
+    if not np.isin(L[2], _INTEGER_EXPONENTS).all():
+        return None
+    if not (np.isfinite(k_const).all() and np.isfinite(S[2]).all()):
+        return None
+    namespace: Dict[str, Any] = {}
+    exec(compile(rhs_source(S, k_const, L), "<rhs>", "exec"), namespace)
+    rhs: RHSFunction = namespace["_rhs"]
+    return rhs
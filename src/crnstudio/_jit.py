@@ -0,0 +1,41 @@
+"""Optional Numba acceleration with a pure-Python fallback."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar, cast
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba installed
+    NUMBA_AVAILABLE = False
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Parallel loop range for kernels compiled with ``parallel=True``; plain range otherwise.
+prange = numba.prange if NUMBA_AVAILABLE else range
+
+
+def njit(
+    *, cache: bool = False, fastmath: bool = False, parallel: bool = False
+) -> Callable[[F], F]:
+    """Compile a function with ``numba.njit`` when Numba is installed.
+
+    Args:
+        cache: Persist compiled machine code to the on-disk cache.
+        fastmath: Allow floating-point reassociation and related optimizations.
+        parallel: Enable automatic parallelization, including ``prange`` loops.
+
+    Returns:
+        A decorator returning the compiled function, or the function unchanged
+        when Numba is unavailable.
+
+    """
+
+    def decorate(func: F) -> F:
+        if not NUMBA_AVAILABLE:
+            return func
+        return cast(F, numba.njit(cache=cache, fastmath=fastmath, parallel=parallel)(func))
+
+    return decorate
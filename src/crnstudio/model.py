@@ -2,25 +2,42 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Mapping, MutableMapping
+from functools import cached_property
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Tuple
 
+import numpy as np
+from numpy.typing import NDArray
 
-@dataclass(frozen=True)
+CompiledRateLaw = Callable[[float, NDArray[np.float64]], float]
+
+_INTEGER_EXPONENTS = (1.0, 2.0, 3.0)
+
+
+@dataclass(frozen=True, slots=True)
 class Species:
     """A chemical species tracked in the network."""
 
     name: str
 
     def __post_init__(self) -> None:
-        """Validate that the species has a non-empty name.
+        """Validate that the species has a non-empty name and intern it.
+
+        Interned names let equal species compare by string identity when used as keys.
 
         Raises:
+            TypeError: If the name is not a string.
             ValueError: If the name is empty.
 
         """
+        if not isinstance(self.name, str):
+            raise TypeError(f"Species name must be a string, not {type(self.name).__name__}")
         if not self.name:
             raise ValueError("Species name must be non-empty")
+        # str() only normalizes subclasses such as numpy.str_, which sys.intern rejects.
+        object.__setattr__(self, "name", sys.intern(str(self.name)))
 
 
 class RateLaw:
@@ -48,6 +65,39 @@ class RateLaw:
         """
         return self._law(t, concentrations)
 
+    def compile(self, name_to_idx: Mapping[str, int]) -> CompiledRateLaw:
+        """Bind the rate law to an index-ordered concentration array.
+
+        Args:
+            name_to_idx: Mapping from species name to position in the concentration array.
+
+        Returns:
+            Callable taking time and a concentration array and returning a rate.
+
+        """
+
+        def _compiled(t: float, x: NDArray[np.float64]) -> float:
+            return self(t, _ConcentrationView(name_to_idx, x))
+
+        return _compiled
+
+
+class _ConcentrationView(Mapping[str, float]):
+    """Read-only name-keyed view over an index-ordered concentration array."""
+
+    def __init__(self, name_to_idx: Mapping[str, int], x: NDArray[np.float64]) -> None:
+        self._name_to_idx = name_to_idx
+        self._x = x
+
+    def __getitem__(self, name: str) -> float:
+        return float(self._x[self._name_to_idx[name]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._name_to_idx)
+
+    def __len__(self) -> int:
+        return len(self._name_to_idx)
+
 
 @dataclass(frozen=True)
 class Reaction:
@@ -75,13 +125,35 @@ class Reaction:
             if stoich <= 0:
                 raise ValueError("Product stoichiometry must be positive")
 
-    def net_change(self) -> Dict[Species, float]:
-        """Compute net stoichiometric change per reaction event.
+    @classmethod
+    def _unsafe_new(
+        cls,
+        reactants: Mapping[Species, float],
+        products: Mapping[Species, float],
+        rate_law: RateLaw,
+    ) -> Reaction:
+        """Construct a reaction without running validation.
+
+        Internal: for trusted callers such as parameter sweeps that rebuild reactions
+        from stoichiometries already validated on an existing instance.
+
+        Args:
+            reactants: Reactant stoichiometries, assumed non-empty and positive.
+            products: Product stoichiometries, assumed non-empty and positive.
+            rate_law: Rate law for the reaction.
 
         Returns:
-            Mapping from Species to net stoichiometric change (products - reactants).
+            A new Reaction sharing the given mappings.
 
         """
+        reaction = object.__new__(cls)
+        object.__setattr__(reaction, "reactants", reactants)
+        object.__setattr__(reaction, "products", products)
+        object.__setattr__(reaction, "rate_law", rate_law)
+        return reaction
+
+    @cached_property
+    def _net_change(self) -> Dict[Species, float]:
         delta: Dict[Species, float] = {}
         for species, stoich in self.products.items():
             delta[species] = delta.get(species, 0.0) + stoich
@@ -89,8 +161,89 @@ class Reaction:
             delta[species] = delta.get(species, 0.0) - stoich
         return delta
 
+    def net_change(self) -> Dict[Species, float]:
+        """Compute net stoichiometric change per reaction event.
+
+        The result is computed once per reaction and cached; callers receive a copy.
+
+        Returns:
+            Mapping from Species to net stoichiometric change (products - reactants).
+
+        """
+        return dict(self._net_change)
 
-def mass_action(rate_constant: float, reactants: Mapping[Species, float]) -> RateLaw:
+
+@dataclass(frozen=True, eq=False)
+class MassActionLaw(RateLaw):
+    """A mass-action rate law with an explicit rate constant and reactant exponents.
+
+    Unlike an opaque RateLaw callable, the parameters are inspectable, which lets
+    simulators assemble them into vectorized or compiled rate evaluations.
+    """
+
+    rate_constant: float
+    exponents: Mapping[Species, float]
+
+    def __post_init__(self) -> None:
+        """Validate the rate constant and freeze a copy of the exponents.
+
+        Raises:
+            ValueError: If rate_constant is negative.
+
+        """
+        if self.rate_constant < 0:
+            raise ValueError("Rate constant must be non-negative")
+        object.__setattr__(self, "exponents", MappingProxyType(dict(self.exponents)))
+
+    def __call__(self, t: float, concentrations: Mapping[str, float]) -> float:
+        """Evaluate ``k * prod(c_i ** e_i)`` at the given concentrations.
+
+        Args:
+            t: Current time (unused; mass-action kinetics are autonomous).
+            concentrations: Mapping of species name to concentration.
+
+        Returns:
+            Computed reaction rate as a float.
+
+        """
+        rate = self.rate_constant
+        for species, stoich in self.exponents.items():
+            rate *= concentrations[species.name] ** stoich
+        return rate
+
+    def compile(self, name_to_idx: Mapping[str, int]) -> CompiledRateLaw:
+        """Bind the rate law to integer species indices.
+
+        Args:
+            name_to_idx: Mapping from species name to position in the concentration array.
+
+        Returns:
+            Callable taking time and a concentration array and returning a rate.
+
+        """
+        rate_constant = self.rate_constant
+        # Small integer exponents become repeated multiplications instead of pow() calls.
+        repeated: List[int] = []
+        powers: List[Tuple[int, float]] = []
+        for sp, exponent in self.exponents.items():
+            i = name_to_idx[sp.name]
+            if exponent in _INTEGER_EXPONENTS:
+                repeated.extend([i] * int(exponent))
+            else:
+                powers.append((i, float(exponent)))
+
+        def _compiled(_: float, x: NDArray[np.float64]) -> float:
+            rate = rate_constant
+            for i in repeated:
+                rate *= x[i]
+            for i, exponent in powers:
+                rate *= x[i] ** exponent
+            return rate
+
+        return _compiled
+
+
+def mass_action(rate_constant: float, reactants: Mapping[Species, float]) -> MassActionLaw:
     """Create a mass-action rate law parameterized by reactants.
 
     Args:
@@ -98,22 +251,13 @@ def mass_action(rate_constant: float, reactants: Mapping[Species, float]) -> Rat
         reactants: Mapping from Species to stoichiometric coefficients.
 
     Returns:
-        A RateLaw implementing mass-action kinetics.
+        A MassActionLaw implementing mass-action kinetics.
 
     Raises:
         ValueError: If rate_constant is negative.
 
     """
-    if rate_constant < 0:
-        raise ValueError("Rate constant must be non-negative")
-
-    def _law(_: float, concentrations: Mapping[str, float]) -> float:
-        rate = rate_constant
-        for species, stoich in reactants.items():
-            rate *= concentrations[species.name] ** stoich
-        return rate
-
-    return RateLaw(_law)
+    return MassActionLaw(rate_constant, reactants)
 
 
 def ensure_concentrations(
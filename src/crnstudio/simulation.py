@@ -2,13 +2,90 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, Sequence
+from types import ModuleType
+from typing import (
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from .model import Reaction, Species, ensure_concentrations, update_concentrations
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from scipy.integrate import solve_ivp
+from scipy.linalg import expm
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.linalg import expm_multiply
+
+from ._codegen import RHSFunction, compile_rhs
+from ._jit import NUMBA_AVAILABLE
+from ._kernels import CSRArrays, rk4_integrate, rk4_integrate_many
+from .model import (
+    _INTEGER_EXPONENTS,
+    MassActionLaw,
+    RateLaw,
+    Reaction,
+    Species,
+    ensure_concentrations,
+)
+
+_SPARSE_DENSITY = 0.1
+# A sampled expm_multiply costs roughly as much as RK4 steps touching ~20k nonzeros of
+# K, so a sparse linear network is only solved exactly when each recorded sample
+# replaces at least that much stepping work (steps x nnz(K)).
+_EXPM_MIN_WORK_PER_SAMPLE = 20_000
+
+
+class SimulationResult(NamedTuple):
+    """Concentration trajectories sampled on a time grid.
+
+    Attributes:
+        times: Sample times of shape ``(T,)``.
+        values: Concentrations of shape ``(T, n_species)``, or ``(T, n_batch, n_species)``
+            for batched runs, with the last axis ordered like ``names``. A CuPy array
+            for ``simulate_batch_gpu``.
+        names: Species names.
+
+    """
+
+    times: NDArray[np.float64]
+    values: NDArray[np.float64]
+    names: List[str]
+
+    def as_dicts(self) -> List[Dict[str, float]]:
+        """Convert the trajectory to one name->concentration mapping per sample.
+
+        Returns:
+            List of concentration snapshots, one per sample time.
+
+        Raises:
+            ValueError: If the result holds a batch of trajectories.
+
+        """
+        if self.values.ndim != 2:
+            raise ValueError("as_dicts requires a single trajectory; index the batch first")
+        return [dict(zip(self.names, row, strict=True)) for row in self.values.tolist()]
+
+
+def _csr_arrays(A: csr_matrix) -> CSRArrays:
+    """Split a CSR matrix into the ``(indptr, indices, data)`` triple used by the kernels."""
+    return (
+        np.asarray(A.indptr, dtype=np.int32),
+        np.asarray(A.indices, dtype=np.int32),
+        np.asarray(A.data, dtype=np.float64),
+    )
 
 
 class DeterministicSimulator:
-    """Fixed-step Runge–Kutta 4 ODE integrator for CRNs."""
+    """Fixed-step Runge–Kutta 4 ODE integrator for CRNs.
+
+    Networks of first-order mass-action reactions are linear and are solved exactly with
+    the matrix exponential instead, when that is cheaper than stepping.
+    """
 
     def __init__(self, species: Sequence[Species], reactions: Sequence[Reaction]) -> None:
         """Initialize the simulator with species and reactions.
@@ -18,7 +95,8 @@ class DeterministicSimulator:
             reactions: Sequence of Reaction objects.
 
         Raises:
-            ValueError: If no species are provided.
+            ValueError: If no species are provided, species names repeat or a reaction
+                references an unknown species.
 
         """
         if not species:
@@ -26,70 +104,825 @@ class DeterministicSimulator:
         self.species = list(species)
         self.reactions = list(reactions)
 
-    def derivative(self, t: float, concentrations: Mapping[str, float]) -> Dict[str, float]:
+        self._compile()
+
+    def _network_identity(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Identify the current network by the objects in ``species`` and ``reactions``."""
+        return tuple(map(id, self.species)), tuple(map(id, self.reactions))
+
+    def _ensure_compiled(self) -> None:
+        """Recompile the network if ``species`` or ``reactions`` changed since last use."""
+        if self._network_identity() != self._network_key:
+            self._compile()
+
+    def _compile(self) -> None:
+        """Assemble stoichiometry, rate-law arrays and the generated RHS for the network.
+
+        The result is kept on the instance and reused by every ``simulate`` call until
+        the species or reactions lists change.
+
+        Raises:
+            ValueError: If species names repeat or a reaction or rate law references an
+                unknown species.
+
+        """
+        # Hold the objects alongside their ids so the ids cannot be reused while cached.
+        self._network = (tuple(self.species), tuple(self.reactions))
+        n_species, n_reactions = len(self.species), len(self.reactions)
+        self._names = [sp.name for sp in self.species]
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        if len(self._idx) != len(self._names):
+            raise ValueError("Species names must be unique")
+        # Each reaction's net change as (species indices, coefficients) arrays; S is
+        # assembled from these by concatenation rather than entry by entry.
+        self._reactions_compact: List[Tuple[NDArray[np.intp], NDArray[np.float64]]] = []
+        for reaction in self.reactions:
+            net_change = reaction.net_change()
+            for sp in net_change:
+                if sp.name not in self._idx:
+                    raise ValueError(f"Reaction references unknown species {sp.name}")
+            nonzero = [(self._idx[sp.name], c) for sp, c in net_change.items() if c != 0.0]
+            self._reactions_compact.append(
+                (
+                    np.array([i for i, _ in nonzero], dtype=np.intp),
+                    np.array([c for _, c in nonzero], dtype=np.float64),
+                )
+            )
+        s_rows = np.concatenate([np.empty(0, np.intp)] + [i for i, _ in self._reactions_compact])
+        s_vals = np.concatenate([np.empty(0)] + [v for _, v in self._reactions_compact])
+        s_cols = np.repeat(np.arange(n_reactions), [len(i) for i, _ in self._reactions_compact])
+        S = csr_matrix((s_vals, (s_rows, s_cols)), shape=(n_species, n_reactions))
+        self._S_csr = _csr_arrays(S)
+        # Large reaction networks are mostly zeros; keep S sparse below the density cutoff.
+        self._sparse = S.nnz < _SPARSE_DENSITY * n_species * n_reactions
+        self._S: Union[NDArray[np.float64], csr_matrix] = S if self._sparse else S.toarray()
+
+        # Mass-action reactions are evaluated from k_const and a reaction-major exponent
+        # matrix L in one vectorized pass; other rate laws use a per-reaction fallback.
+        self._k_const = np.zeros(n_reactions)
+        rows, cols, vals = [], [], []
+        self._generic: List[Tuple[int, RateLaw]] = []
+        for j, reaction in enumerate(self.reactions):
+            law = reaction.rate_law
+            if not isinstance(law, MassActionLaw):
+                self._generic.append((j, law))
+                continue
+            self._k_const[j] = law.rate_constant
+            for sp, exponent in law.exponents.items():
+                if sp.name not in self._idx:
+                    raise ValueError(f"Rate law references unknown species {sp.name}")
+                if exponent != 0.0:
+                    rows.append(j)
+                    cols.append(self._idx[sp.name])
+                    vals.append(exponent)
+        L = csr_matrix((vals, (rows, cols)), shape=(n_reactions, n_species))
+        self._L = _csr_arrays(L)
+        self._L_rows = np.flatnonzero(np.diff(self._L[0]))
+
+        # Padded reactant table: row j lists reaction j's reactants at positions
+        # _pad_slots; padded slots have exponent 0 so they contribute a factor of 1.
+        counts = np.diff(L.indptr)
+        order = int(counts.max()) if counts.size else 0
+        self._pad_rows = np.repeat(np.arange(n_reactions), counts)
+        self._pad_slots = np.arange(L.nnz) - np.repeat(L.indptr[:-1], counts)
+        self._pad_idx = np.zeros((n_reactions, order), dtype=np.intp)
+        self._pad_exp = np.zeros((n_reactions, order))
+        self._pad_idx[self._pad_rows, self._pad_slots] = L.indices
+        self._pad_exp[self._pad_rows, self._pad_slots] = L.data
+
+        # When every reaction is first-order mass-action the system is linear,
+        # dx/dt = K x with K = S diag(k) L, and can be solved exactly instead of stepped.
+        self._K: Optional[Union[NDArray[np.float64], csr_matrix]] = None
+        if not self._generic and np.all(np.diff(L.indptr) == 1) and np.all(L.data == 1.0):
+            K = csr_matrix(S @ diags(self._k_const) @ L)
+            self._K = K if self._sparse else K.toarray()
+
+        # For the NumPy path, expand small integer exponents into repeated gathers so
+        # that only fractional or large exponents need an elementwise pow().
+        indptr, indices, data = self._L
+        gather: List[int] = []
+        starts: List[int] = []
+        pow_pos: List[int] = []
+        pow_exp: List[float] = []
+        for j in self._L_rows.tolist():
+            starts.append(len(gather))
+            for k in range(indptr[j], indptr[j + 1]):
+                if data[k] in _INTEGER_EXPONENTS:
+                    gather.extend([int(indices[k])] * int(data[k]))
+                else:
+                    pow_pos.append(len(gather))
+                    pow_exp.append(float(data[k]))
+                    gather.append(int(indices[k]))
+        self._gather = np.array(gather, dtype=np.intp)
+        self._gather_starts = np.array(starts, dtype=np.intp)
+        self._pow_pos = np.array(pow_pos, dtype=np.intp)
+        self._pow_exp = np.array(pow_exp, dtype=float)
+        self._mass_action = not self._generic
+        self._compiled = [(j, law.compile(self._idx)) for j, law in self._generic]
+        self._rhs: Optional[RHSFunction] = None
+        if self._mass_action:
+            self._rhs = compile_rhs(self._S_csr, self._k_const, self._L)
+        self._network_key: Tuple[Tuple[int, ...], Tuple[int, ...]] = self._network_identity()
+
+    def _rate_vec(self, t: float, x: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Evaluate every reaction rate at time t.
+
+        Args:
+            t: Current time.
+            x: Concentrations ordered like ``self.species``, optionally with leading
+                batch axes.
+
+        Returns:
+            Array of reaction rates ordered like ``self.reactions``, with the same leading
+            batch axes as ``x``.
+
+        """
+        rates = np.empty(x.shape[:-1] + (len(self.reactions),))
+        rates[...] = self._k_const
+        if self._L_rows.size:
+            factors = x[..., self._gather]
+            if self._pow_pos.size:
+                factors[..., self._pow_pos] **= self._pow_exp
+            rates[..., self._L_rows] *= np.multiply.reduceat(factors, self._gather_starts, axis=-1)
+        if self._compiled:
+            batch_x = x.reshape(-1, x.shape[-1])
+            batch_rates = rates.reshape(-1, len(self.reactions))
+            for j, law in self._compiled:
+                for xb, rb in zip(batch_x, batch_rates, strict=True):
+                    rb[j] = law(t, xb)
+        return rates
+
+    def derivative(
+        self, t: float, x: NDArray[np.float64], out: Optional[NDArray[np.float64]] = None
+    ) -> NDArray[np.float64]:
         """Compute the time derivatives of concentrations at time t.
 
         Args:
             t: Current time.
-            concentrations: Mapping from species name to concentration.
+            x: Concentrations ordered like ``self.species``, optionally with leading
+                batch axes.
+            out: Optional preallocated array that receives the result.
 
         Returns:
-            Mapping from species name to dC/dt.
+            Array of dC/dt shaped like ``x``.
 
         """
-        changes: Dict[str, float] = {sp.name: 0.0 for sp in self.species}
-        for reaction in self.reactions:
-            rate = reaction.rate_law(t, concentrations)
-            for species, stoich in reaction.net_change().items():
-                changes[species.name] += stoich * rate
-        return changes
+        self._ensure_compiled()
+        return self._derivative(t, x, out)
+
+    def _derivative(
+        self, t: float, x: NDArray[np.float64], out: Optional[NDArray[np.float64]] = None
+    ) -> NDArray[np.float64]:
+        """Compute dC/dt like ``derivative`` without checking for network changes.
+
+        The integrators call this in their inner loops after ``_ensure_compiled`` has
+        run once at the public entry point.
+        """
+        if self._rhs is not None and x.ndim == 1:
+            if out is None:
+                out = np.empty(len(self.species))
+            self._rhs(t, x, out)
+            return out
+        rates = self._rate_vec(t, x)
+        if isinstance(self._S, np.ndarray):
+            return np.matmul(rates, self._S.T, out=out)
+        changes: NDArray[np.float64] = (self._S @ rates.T).T
+        if out is None:
+            return changes
+        out[...] = changes
+        return out
 
     def simulate(
-        self, t_span: Sequence[float], initial_conditions: Mapping[str, float], dt: float
-    ) -> List[Dict[str, float]]:
-        """Simulate the ODEs using a fixed-step RK4 integrator.
+        self,
+        t_span: Sequence[float],
+        initial_conditions: Mapping[str, float],
+        dt: float,
+        snapshot_every: int = 1,
+    ) -> SimulationResult:
+        """Simulate the ODEs on a fixed reporting grid.
+
+        The grid points are ``t0 + k * dt``. Between them the simulator's integrator
+        advances the state, or linear networks are propagated exactly.
 
         Args:
             t_span: Sequence [t0, t1] specifying simulation interval.
             initial_conditions: Mapping from species name to initial concentration.
             dt: Time step size.
+            snapshot_every: Record every Nth step. The initial and final states are
+                always recorded.
 
         Returns:
-            List of concentration snapshots (mapping name->value), including the initial state.
+            SimulationResult holding the sampled times and concentrations, including the
+            initial state.
 
         Raises:
-            ValueError: If t_span is invalid or dt is non-positive.
+            ValueError: If t_span is invalid, dt is non-positive or snapshot_every < 1.
+
+        """
+        self._ensure_compiled()
+        t0, sample_steps = self._time_grid(t_span, dt, snapshot_every)
+        concentrations = ensure_concentrations(self.species, initial_conditions)
+        states = np.empty((len(sample_steps), len(self.species)))
+        states[0] = [concentrations[name] for name in self._names]
+
+        self._advance(states, t0, dt, sample_steps)
+
+        times = t0 + dt * sample_steps.astype(np.float64)
+        return SimulationResult(times, states, list(self._names))
+
+    def simulate_batch(
+        self,
+        t_span: Sequence[float],
+        initial_conditions: ArrayLike,
+        dt: float,
+        snapshot_every: int = 1,
+    ) -> SimulationResult:
+        """Simulate many initial conditions at once, vectorized across the batch.
+
+        Args:
+            t_span: Sequence [t0, t1] specifying simulation interval.
+            initial_conditions: Array of shape ``(n_batch, n_species)`` with columns
+                ordered like ``self.species``.
+            dt: Time step size.
+            snapshot_every: Record every Nth step. The initial and final states are
+                always recorded.
+
+        Returns:
+            SimulationResult whose values have shape ``(n_samples, n_batch, n_species)``,
+            including the initial states.
+
+        Raises:
+            ValueError: If t_span, dt, snapshot_every or the initial conditions are invalid.
+
+        """
+        self._ensure_compiled()
+        t0, sample_steps = self._time_grid(t_span, dt, snapshot_every)
+        x0 = np.array(initial_conditions, dtype=float)
+        if x0.ndim != 2 or x0.shape[1] != len(self.species):
+            raise ValueError("Initial conditions must have shape (n_batch, n_species)")
+        if np.any(x0 < 0):
+            raise ValueError("Concentrations must be non-negative")
+        states = np.empty((len(sample_steps),) + x0.shape)
+        states[0] = x0
+
+        self._advance(states, t0, dt, sample_steps)
+
+        times = t0 + dt * sample_steps.astype(np.float64)
+        return SimulationResult(times, states, list(self._names))
+
+    def simulate_batch_gpu(
+        self,
+        t_span: Sequence[float],
+        initial_conditions: ArrayLike,
+        dt: float,
+        snapshot_every: int = 1,
+    ) -> SimulationResult:
+        """Simulate a large batch of initial conditions with RK4 on a CUDA device.
+
+        The whole batch advances together, so each RK4 stage is a few device kernels over
+        every replicate. This only pays off for sweeps of many replicates; use ``simulate``
+        for single trajectories. Requires the optional CuPy dependency. Only the base
+        fixed-step simulator supports it; subclasses with their own integrator raise.
+
+        Args:
+            t_span: Sequence [t0, t1] specifying simulation interval.
+            initial_conditions: Host or device array of shape ``(n_batch, n_species)``.
+            dt: Time step size.
+            snapshot_every: Record every Nth step. The initial and final states are
+                always recorded.
+
+        Returns:
+            SimulationResult with host ``times`` and ``names`` and CuPy ``values`` of shape
+            ``(n_samples, n_batch, n_species)`` on the device.
+
+        Raises:
+            NotImplementedError: If called on a subclass that replaces the RK4 integrator.
+            ImportError: If CuPy is not installed.
+            ValueError: If the network has non-mass-action rate laws or the inputs are
+                invalid.
+
+        """
+        if type(self)._integrate is not DeterministicSimulator._integrate:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support simulate_batch_gpu; its integrator "
+                "has no device implementation"
+            )
+        try:
+            import cupy
+            import cupyx.scipy.sparse
+        except ImportError as exc:
+            raise ImportError("simulate_batch_gpu requires CuPy (crnstudio[gpu])") from exc
+
+        self._ensure_compiled()
+        if isinstance(self._S, np.ndarray):
+            S = cupy.asarray(self._S)
+        else:
+            S = cupyx.scipy.sparse.csr_matrix(self._S)
+        return self._simulate_mass_action_batch(
+            cupy, S, t_span, initial_conditions, dt, snapshot_every
+        )
+
+    def _simulate_mass_action_batch(
+        self,
+        xp: ModuleType,
+        S: Union[NDArray[np.float64], csr_matrix],
+        t_span: Sequence[float],
+        initial_conditions: ArrayLike,
+        dt: float,
+        snapshot_every: int = 1,
+    ) -> SimulationResult:
+        """Run batched mass-action RK4 with the array module ``xp`` (NumPy or CuPy).
+
+        Args:
+            xp: Array module providing ``asarray``, ``empty``, ``prod`` and ``any``.
+            S: Stoichiometry matrix already resident on ``xp``'s device.
+            t_span: Sequence [t0, t1] specifying simulation interval.
+            initial_conditions: Array of shape ``(n_batch, n_species)``.
+            dt: Time step size.
+            snapshot_every: Record every Nth step, plus the initial and final states.
+
+        Returns:
+            SimulationResult with host ``times`` and ``names`` and ``values`` of shape
+            ``(n_samples, n_batch, n_species)`` from ``xp``.
+
+        Raises:
+            ValueError: If the network has non-mass-action rate laws or the inputs are
+                invalid.
+
+        """
+        if not self._mass_action:
+            raise ValueError("Batched device simulation requires mass-action rate laws")
+        t0, sample_steps = self._time_grid(t_span, dt, snapshot_every)
+        x = xp.asarray(initial_conditions, dtype=np.float64)
+        if x.ndim != 2 or x.shape[1] != len(self.species):
+            raise ValueError("Initial conditions must have shape (n_batch, n_species)")
+        if bool(xp.any(x < 0)):
+            raise ValueError("Concentrations must be non-negative")
+
+        idx = xp.asarray(self._pad_idx)
+        exp = xp.asarray(self._pad_exp)
+        k_const = xp.asarray(self._k_const)
+
+        def f(x: NDArray[np.float64]) -> NDArray[np.float64]:
+            rates = k_const * xp.prod(x[:, idx] ** exp, axis=-1)
+            changes: NDArray[np.float64] = (S @ rates.T).T
+            return changes
+
+        states: NDArray[np.float64] = xp.empty((len(sample_steps),) + x.shape)
+        states[0] = x
+        half_dt = 0.5 * dt
+        sixth_dt = dt / 6.0
+        row = 1
+        for i in range(1, int(sample_steps[-1]) + 1):
+            k1 = f(x)
+            k2 = f(x + half_dt * k1)
+            k3 = f(x + half_dt * k2)
+            k4 = f(x + dt * k3)
+            x = x + sixth_dt * (k1 + 2.0 * (k2 + k3) + k4)
+            if i == sample_steps[row]:
+                states[row] = x
+                row += 1
+
+        times = t0 + dt * sample_steps.astype(np.float64)
+        return SimulationResult(times, states, list(self._names))
+
+    @staticmethod
+    def _time_grid(
+        t_span: Sequence[float], dt: float, snapshot_every: int
+    ) -> Tuple[float, NDArray[np.intp]]:
+        """Validate the simulation interval and choose which steps to record.
+
+        Args:
+            t_span: Sequence [t0, t1] specifying simulation interval.
+            dt: Time step size.
+            snapshot_every: Record every Nth step.
+
+        Returns:
+            Tuple of the start time and the increasing step indices to record, always
+            including the first (0) and the last step.
+
+        Raises:
+            ValueError: If t_span is invalid, dt is non-positive or snapshot_every < 1.
 
         """
         if len(t_span) != 2 or t_span[1] <= t_span[0]:
             raise ValueError("t_span must be [t0, t1] with t1 > t0")
         if dt <= 0:
             raise ValueError("Time step must be positive")
-
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
         t0, t1 = float(t_span[0]), float(t_span[1])
-        concentrations = ensure_concentrations(self.species, initial_conditions)
-        snapshots: List[Dict[str, float]] = [dict(concentrations)]
-
         steps = int((t1 - t0) / dt)
+        sample_steps = np.arange(0, steps + 1, snapshot_every, dtype=np.intp)
+        if sample_steps[-1] != steps:
+            sample_steps = np.append(sample_steps, steps)
+        return t0, sample_steps
+
+    def _advance(
+        self,
+        states: NDArray[np.float64],
+        t0: float,
+        dt: float,
+        sample_steps: NDArray[np.intp],
+    ) -> None:
+        """Fill ``states`` by exact propagation when cheaper, otherwise by integration.
+
+        Args:
+            states: Preallocated array of shape ``(len(sample_steps), ..., n_species)``
+                whose first row holds the initial state.
+            t0: Time of ``states[0]``.
+            dt: Time step size.
+            sample_steps: Increasing step indices to record, starting at 0.
+
+        """
+        K = self._K
+        if K is not None and (
+            isinstance(K, np.ndarray)
+            or sample_steps[-1] * K.nnz >= _EXPM_MIN_WORK_PER_SAMPLE * (len(sample_steps) - 1)
+        ):
+            self._propagate_linear(K, states, dt, sample_steps)
+        else:
+            self._integrate(states, t0, dt, sample_steps)
+
+    @staticmethod
+    def _propagate_linear(
+        K: Union[NDArray[np.float64], csr_matrix],
+        states: NDArray[np.float64],
+        dt: float,
+        sample_steps: NDArray[np.intp],
+    ) -> None:
+        """Fill ``states`` from ``states[0]`` with the exact solution of ``dx/dt = K x``.
+
+        Args:
+            K: Dense or sparse rate matrix of the linear network.
+            states: Preallocated array of shape ``(len(sample_steps), ..., n_species)``
+                whose first row holds the initial state.
+            dt: Time step size.
+            sample_steps: Increasing step indices of the recorded states.
+
+        """
+        intervals = np.diff(sample_steps).tolist()
+        if isinstance(K, np.ndarray):
+            propagators: Dict[int, NDArray[np.float64]] = {}
+            for row, steps in enumerate(intervals, start=1):
+                if steps not in propagators:
+                    propagators[steps] = expm(K * (steps * dt))
+                np.matmul(states[row - 1], propagators[steps].T, out=states[row])
+            return
+        if not intervals:
+            return
+        # Only the final interval can be shorter; sample the uniform part in one call.
+        n_uniform = len(intervals) if intervals[-1] == intervals[0] else len(intervals) - 1
+        grid = expm_multiply(
+            K,
+            states[0].T,
+            start=0.0,
+            stop=n_uniform * intervals[0] * dt,
+            num=n_uniform + 1,
+            endpoint=True,
+        )
+        states[1 : n_uniform + 1] = np.moveaxis(grid[1:], 1, -1)
+        if n_uniform < len(intervals):
+            states[-1] = expm_multiply(K * (intervals[-1] * dt), states[-2].T).T
+
+    def _integrate(
+        self,
+        states: NDArray[np.float64],
+        t0: float,
+        dt: float,
+        sample_steps: NDArray[np.intp],
+    ) -> None:
+        """Fill ``states[k]`` with the solution at ``t0 + sample_steps[k] * dt``.
+
+        Args:
+            states: Preallocated array of shape ``(len(sample_steps), ..., n_species)``
+                whose first row holds the initial state.
+            t0: Time of ``states[0]``.
+            dt: Time step size.
+            sample_steps: Increasing step indices to record, starting at 0.
+
+        """
+        if NUMBA_AVAILABLE and self._mass_action and states.ndim == 2:
+            rk4_integrate(states[0], dt, sample_steps, self._S_csr, self._k_const, self._L, states)
+        elif NUMBA_AVAILABLE and self._mass_action and states.ndim == 3:
+            # Batches are independent trajectories; run them on parallel threads.
+            rk4_integrate_many(
+                states[0], dt, sample_steps, self._S_csr, self._k_const, self._L, states
+            )
+        else:
+            self._integrate_rk4(states, t0, dt, sample_steps)
+
+    def _integrate_rk4(
+        self,
+        states: NDArray[np.float64],
+        t0: float,
+        dt: float,
+        sample_steps: NDArray[np.intp],
+    ) -> None:
+        """Integrate with RK4 using reusable stage buffers, recording sampled steps.
+
+        Args:
+            states: Preallocated array of shape ``(len(sample_steps), ..., n_species)``
+                whose first row holds the initial state.
+            t0: Time of ``states[0]``.
+            dt: Time step size.
+            sample_steps: Increasing step indices to record, starting at 0.
+
+        """
+        shape = states.shape[1:]
+        x = states[0].copy()
+        k1 = np.empty(shape)
+        k2 = np.empty(shape)
+        k3 = np.empty(shape)
+        k4 = np.empty(shape)
+        tmp = np.empty(shape)
+
+        half_dt = 0.5 * dt
+        sixth_dt = dt / 6.0
+        t = t0
+        row = 1
+        for i in range(1, int(sample_steps[-1]) + 1):
+            t_half = t + half_dt
+            t_next = t + dt
+            self._derivative(t, x, out=k1)
+            np.multiply(k1, half_dt, out=tmp)
+            np.add(x, tmp, out=tmp)
+            self._derivative(t_half, tmp, out=k2)
+            np.multiply(k2, half_dt, out=tmp)
+            np.add(x, tmp, out=tmp)
+            self._derivative(t_half, tmp, out=k3)
+            np.multiply(k3, dt, out=tmp)
+            np.add(x, tmp, out=tmp)
+            self._derivative(t_next, tmp, out=k4)
+
+            # x += dt/6 * (k1 + 2 * (k2 + k3) + k4)
+            np.add(k2, k3, out=tmp)
+            np.multiply(tmp, 2.0, out=tmp)
+            np.add(tmp, k1, out=tmp)
+            np.add(tmp, k4, out=tmp)
+            np.multiply(tmp, sixth_dt, out=tmp)
+            np.add(x, tmp, out=x)
+            t = t_next
+            if i == sample_steps[row]:
+                states[row] = x
+                row += 1
+
+
+# Dormand–Prince 5(4) tableau with the free fourth-order dense-output polynomial.
+_DP_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0])
+_DP_A = np.array(
+    [
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+        [1 / 5, 0.0, 0.0, 0.0, 0.0],
+        [3 / 40, 9 / 40, 0.0, 0.0, 0.0],
+        [44 / 45, -56 / 15, 32 / 9, 0.0, 0.0],
+        [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0.0],
+        [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    ]
+)
+_DP_B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+_DP_E = np.array([-71 / 57600, 0.0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+_DP_P = np.array(
+    [
+        [1.0, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+        [0.0, 0.0, 0.0, 0.0],
+        [
+            0.0,
+            131558114200 / 32700410799,
+            -68118460800 / 10900136933,
+            87487479700 / 32700410799,
+        ],
+        [0.0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+        [
+            0.0,
+            127303824393 / 49829197408,
+            -318862633887 / 49829197408,
+            701980252875 / 199316789632,
+        ],
+        [0.0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+        [0.0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+    ]
+)
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.0
+
+
+class AdaptiveDP45Simulator(DeterministicSimulator):
+    """Adaptive Dormand–Prince RK45 ODE integrator for CRNs.
+
+    Internal steps are chosen from an embedded local error estimate; ``dt`` passed to
+    ``simulate`` only sets the reporting grid, which is filled by dense output.
+    """
+
+    def __init__(
+        self,
+        species: Sequence[Species],
+        reactions: Sequence[Reaction],
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+    ) -> None:
+        """Initialize the simulator with species, reactions and error tolerances.
+
+        Args:
+            species: Sequence of Species present in the network.
+            reactions: Sequence of Reaction objects.
+            rtol: Relative tolerance on the local error of each step.
+            atol: Absolute tolerance on the local error of each step.
+
+        Raises:
+            ValueError: If no species are provided or a tolerance is non-positive.
+
+        """
+        super().__init__(species, reactions)
+        if rtol <= 0 or atol <= 0:
+            raise ValueError("Tolerances must be positive")
+        self.rtol = rtol
+        self.atol = atol
+
+    def _integrate(
+        self,
+        states: NDArray[np.float64],
+        t0: float,
+        dt: float,
+        sample_steps: NDArray[np.intp],
+    ) -> None:
+        """Fill ``states[k]`` with the solution at ``t0 + sample_steps[k] * dt`` adaptively.
+
+        Batched trajectories share one step size, controlled by the error across the batch.
+
+        Args:
+            states: Preallocated array of shape ``(len(sample_steps), ..., n_species)``
+                whose first row holds the initial state.
+            t0: Time of ``states[0]``.
+            dt: Reporting interval, also used as the initial step size.
+            sample_steps: Increasing multiples of dt to report, starting at 0.
+
+        Raises:
+            RuntimeError: If the step size underflows.
+
+        """
+        n_out = states.shape[0]
+        out_times = t0 + dt * sample_steps.astype(np.float64)
+        t_end = out_times[-1]
+        K = np.empty((7,) + states.shape[1:])
         t = t0
-        for _ in range(steps):
-            k1 = self.derivative(t, concentrations)
-            mid1 = {name: conc + 0.5 * dt * k1[name] for name, conc in concentrations.items()}
+        x = states[0].copy()
+        h = dt
+        self._derivative(t, x, out=K[0])
+
+        i_out = 1
+        while i_out < n_out:
+            last = t + h >= t_end
+            if last:
+                h = t_end - t
+            for s in range(1, 6):
+                stage = x + h * np.tensordot(_DP_A[s, :s], K[:s], axes=1)
+                self._derivative(t + _DP_C[s] * h, stage, out=K[s])
+            x_new = x + h * np.tensordot(_DP_B, K[:6], axes=1)
+            t_new = t_end if last else t + h
+            self._derivative(t_new, x_new, out=K[6])
+
+            scale = self.atol + np.maximum(np.abs(x), np.abs(x_new)) * self.rtol
+            err = float(np.sqrt(np.mean((h * np.tensordot(_DP_E, K, axes=1) / scale) ** 2)))
+            if err <= 1.0:
+                while i_out < n_out and out_times[i_out] <= t_new:
+                    theta = (out_times[i_out] - t) / h
+                    weights = _DP_P @ np.cumprod(np.full(4, theta))
+                    states[i_out] = x + h * np.tensordot(weights, K, axes=1)
+                    i_out += 1
+                t, x = t_new, x_new
+                K[0] = K[6]
+                factor = _MAX_FACTOR if err == 0.0 else min(_MAX_FACTOR, _SAFETY * err**-0.2)
+            else:
+                factor = max(_MIN_FACTOR, _SAFETY * err**-0.2)
+            h *= factor
+            if t + h == t:
+                raise RuntimeError("Step size underflow in adaptive integration")
+
 
-            k2 = self.derivative(t + 0.5 * dt, mid1)
-            mid2 = {name: conc + 0.5 * dt * k2[name] for name, conc in concentrations.items()}
+class ImplicitSimulator(DeterministicSimulator):
+    """Implicit BDF ODE integrator for stiff CRNs.
 
-            k3 = self.derivative(t + 0.5 * dt, mid2)
-            end_state = {name: conc + dt * k3[name] for name, conc in concentrations.items()}
+    Steps are taken by ``scipy.integrate.solve_ivp`` with ``method="BDF"``. For
+    mass-action networks the Jacobian is supplied analytically as a sparse matrix, so
+    each Newton iteration factorizes a sparse system instead of a finite-difference
+    estimate. ``dt`` passed to ``simulate`` only sets the reporting grid.
+    """
 
-            k4 = self.derivative(t + dt, end_state)
+    def __init__(
+        self,
+        species: Sequence[Species],
+        reactions: Sequence[Reaction],
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+    ) -> None:
+        """Initialize the simulator with species, reactions and error tolerances.
 
-            derivatives = {
-                name: (k1[name] + 2 * k2[name] + 2 * k3[name] + k4[name]) / 6.0
-                for name in concentrations
-            }
-            update_concentrations(concentrations, derivatives, dt)
-            t += dt
-            snapshots.append(dict(concentrations))
+        Args:
+            species: Sequence of Species present in the network.
+            reactions: Sequence of Reaction objects.
+            rtol: Relative tolerance passed to the BDF solver.
+            atol: Absolute tolerance passed to the BDF solver.
+
+        Raises:
+            ValueError: If no species are provided or a tolerance is non-positive.
 
-        return snapshots
+        """
+        super().__init__(species, reactions)
+        if rtol <= 0 or atol <= 0:
+            raise ValueError("Tolerances must be positive")
+        self.rtol = rtol
+        self.atol = atol
+
+    def _compile(self) -> None:
+        """Assemble the network and the sparse stoichiometry used by the Jacobian."""
+        super()._compile()
+        s_indptr, s_indices, s_data = self._S_csr
+        self._S_sparse = csr_matrix(
+            (s_data, s_indices, s_indptr), shape=(len(self.species), len(self.reactions))
+        )
+        # x**(e - 1) is infinite at zero for exponents below 1; leave those networks to
+        # the solver's finite-difference Jacobian.
+        self._analytic_jac = self._mass_action and not np.any(self._L[2] < 1.0)
+
+    def jacobian(self, t: float, x: NDArray[np.float64]) -> csr_matrix:
+        """Compute the sparse Jacobian of the derivative at time t.
+
+        Uses ``dr_j/dx_i = k_j * L_ji * x_i**(L_ji - 1) * prod_{m != i} x_m**L_jm``, which
+        stays finite at zero concentrations for exponents of at least 1. Exponents below
+        1 give infinite entries there; integration then uses finite differences instead.
+
+        Args:
+            t: Current time.
+            x: Concentrations ordered like ``self.species``.
+
+        Returns:
+            Sparse matrix of shape ``(n_species, n_species)`` holding d(dC/dt)/dC.
+
+        Raises:
+            ValueError: If the network has non-mass-action rate laws.
+
+        """
+        self._ensure_compiled()
+        if not self._mass_action:
+            raise ValueError("An analytic Jacobian requires mass-action rate laws")
+        return self._jacobian(t, x)
+
+    def _jacobian(self, t: float, x: NDArray[np.float64]) -> csr_matrix:
+        """Compute the Jacobian of a mass-action network without checking for changes."""
+        indptr, indices, data = self._L
+        factors = x[self._pad_idx] ** self._pad_exp
+        others = np.empty_like(factors)
+        for slot in range(factors.shape[1]):
+            others[:, slot] = np.prod(np.delete(factors, slot, axis=1), axis=1)
+        values = (
+            self._k_const[self._pad_rows]
+            * data
+            * x[indices] ** (data - 1.0)
+            * others[self._pad_rows, self._pad_slots]
+        )
+        rate_jac = csr_matrix((values, indices, indptr), shape=(len(self.reactions), len(x)))
+        return csr_matrix(self._S_sparse @ rate_jac)
+
+    def _integrate(
+        self,
+        states: NDArray[np.float64],
+        t0: float,
+        dt: float,
+        sample_steps: NDArray[np.intp],
+    ) -> None:
+        """Fill ``states[k]`` with the solution at ``t0 + sample_steps[k] * dt`` using BDF.
+
+        Batched initial conditions are solved one trajectory at a time.
+
+        Args:
+            states: Preallocated array of shape ``(len(sample_steps), ..., n_species)``
+                whose first row holds the initial state.
+            t0: Time of ``states[0]``.
+            dt: Reporting interval.
+            sample_steps: Increasing multiples of dt to report, starting at 0.
+
+        Raises:
+            RuntimeError: If the solver fails.
+
+        """
+        out_times = t0 + dt * sample_steps.astype(np.float64)
+        if len(out_times) == 1:
+            return
+        jac = self._jacobian if self._analytic_jac else None
+        trajectories = states.reshape(len(out_times), -1, len(self.species))
+        for b in range(trajectories.shape[1]):
+            sol = solve_ivp(
+                self._derivative,
+                (t0, out_times[-1]),
+                trajectories[0, b],
+                method="BDF",
+                t_eval=out_times,
+                rtol=self.rtol,
+                atol=self.atol,
+                jac=jac,
+            )
+            if not sol.success:
+                raise RuntimeError(f"Implicit integration failed: {sol.message}")
+            trajectories[:, b] = sol.y.T
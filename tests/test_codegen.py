@@ -0,0 +1,68 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from crnstudio import DeterministicSimulator, Reaction, Species, mass_action
+from crnstudio._codegen import compile_rhs, rhs_source
+
+
+def test_generated_rhs_matches_matrix_form() -> None:
+    a = Species("A")
+    b = Species("B")
+    c = Species("C")
+
+    reactions = [
+        Reaction(
+            reactants={a: 1.0, b: 1.0},
+            products={c: 1.0},
+            rate_law=mass_action(2.0, {a: 1.0, b: 1.0}),
+        ),
+        Reaction(reactants={c: 1.0}, products={a: 2.0}, rate_law=mass_action(0.5, {c: 0.5})),
+        Reaction(reactants={b: 2.0}, products={c: 3.0}, rate_law=mass_action(1.5, {b: 2.0})),
+    ]
+    simulator = DeterministicSimulator([a, b, c], reactions)
+    x = np.array([1.2, 0.4, 2.5])
+
+    source = rhs_source(simulator._S_csr, simulator._k_const, simulator._L)
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)
+    out = np.empty(3)
+    namespace["_rhs"](0.0, x, out)
+
+    np.testing.assert_allclose(out, simulator._S @ simulator._rate_vec(0.0, x), rtol=1e-12)
+
+
+def test_compiled_rhs_is_plain_python() -> None:
+    a = Species("A")
+    b = Species("B")
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(2.0, {a: 2.0}))
+    simulator = DeterministicSimulator([a, b], [reaction])
+
+    rhs = compile_rhs(simulator._S_csr, simulator._k_const, simulator._L)
+
+    # A per-network JIT compile would not be cacheable across simulators.
+    assert rhs is not None and not hasattr(rhs, "py_func")
+    out = np.empty(2)
+    rhs(0.0, np.array([3.0, 0.0]), out)
+    assert out.tolist() == [-18.0, 18.0]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_rhs_is_not_generated_where_python_floats_differ_from_numpy() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    def build(law_exponent: float, rate_constant: float) -> DeterministicSimulator:
+        law = mass_action(rate_constant, {a: law_exponent})
+        return DeterministicSimulator([a, b], [Reaction({a: 1.0}, {b: 1.0}, law)])
+
+    fractional = build(0.5, 1.0)
+    quartic = build(4.0, 1.0)
+    infinite = build(1.0, float("inf"))
+
+    for simulator in (fractional, quartic, infinite):
+        assert simulator._rhs is None
+    assert build(2.0, 1.0)._rhs is not None
+    assert np.isnan(fractional.derivative(0.0, np.array([-1e-9, 0.0]))).all()
+    assert np.isinf(quartic.derivative(0.0, np.array([1e100, 0.0]))).all()
@@ -0,0 +1,80 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from crnstudio._kernels import (
+    csr_matvec,
+    mass_action_derivative,
+    mass_action_derivative_into,
+    mass_action_rates,
+    rk4_integrate,
+    rk4_integrate_many,
+    rk4_step,
+)
+
+
+def _csr(dense: list[list[float]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    A = csr_matrix(np.array(dense))
+    return (A.indptr.astype(np.int32), A.indices.astype(np.int32), A.data.astype(np.float64))
+
+
+def test_csr_matvec() -> None:
+    A = [[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [0.0, 3.0, 0.0]]
+
+    result = csr_matvec(_csr(A), np.array([1.0, 2.0, 3.0]))
+
+    np.testing.assert_allclose(result, np.array(A) @ [1.0, 2.0, 3.0])
+
+
+def test_mass_action_rates() -> None:
+    x = np.array([2.0, 3.0])
+    k_const = np.array([0.5, 2.0, 1.0])
+    L = _csr([[2.0, 1.0], [0.0, 1.0], [3.0, 0.5]])
+
+    rates = mass_action_rates(x, k_const, L)
+
+    np.testing.assert_allclose(rates, [0.5 * 4.0 * 3.0, 2.0 * 3.0, 8.0 * np.sqrt(3.0)])
+
+
+def test_rk4_step_matches_exponential_decay() -> None:
+    S = _csr([[-1.0], [1.0]])
+    k_const = np.array([1.0])
+    L = _csr([[1.0, 0.0]])
+
+    x = np.array([1.0, 0.0])
+    for _ in range(100):
+        x = rk4_step(x, 0.0, 0.01, S, k_const, L)
+
+    np.testing.assert_allclose(x, [np.exp(-1.0), 1.0 - np.exp(-1.0)], rtol=1e-8)
+
+
+def test_parallel_batch_matches_single_trajectories() -> None:
+    S = _csr([[-1.0, 1.0], [1.0, -1.0]])
+    L = _csr([[1.0, 0.0], [0.0, 2.0]])
+    k_const = np.array([1.0, 0.5])
+    sample_steps = np.array([0, 4, 8, 10], dtype=np.intp)
+    x0s = np.array([[1.0, 0.0], [0.2, 0.8], [0.0, 3.0]])
+
+    batch = np.empty((len(sample_steps),) + x0s.shape)
+    rk4_integrate_many(x0s, 0.05, sample_steps, S, k_const, L, batch)
+
+    for b, x0 in enumerate(x0s):
+        single = np.empty((len(sample_steps), 2))
+        rk4_integrate(x0, 0.05, sample_steps, S, k_const, L, single)
+        np.testing.assert_allclose(batch[:, b], single, rtol=1e-12)
+        x = x0
+        for _ in range(10):
+            x = rk4_step(x, 0.0, 0.05, S, k_const, L)
+        np.testing.assert_allclose(single[-1], x, rtol=1e-12)
+
+
+def test_in_place_derivative_matches_allocating_version() -> None:
+    S = _csr([[-1.0, 2.0], [1.0, -1.0]])
+    L = _csr([[1.0, 0.0], [0.0, 0.5]])
+    k_const = np.array([1.5, 0.25])
+    x = np.array([0.7, 2.0])
+    rates = np.empty(2)
+    out = np.empty(2)
+
+    mass_action_derivative_into(x, S, k_const, L, rates, out)
+
+    np.testing.assert_allclose(out, mass_action_derivative(x, S, k_const, L), rtol=1e-12)
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from crnstudio import MassActionLaw, RateLaw, Reaction, Species, mass_action
+
+
+def test_mass_action_law_exposes_parameters() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    law = mass_action(2.0, {a: 2.0, b: 1.0})
+
+    assert isinstance(law, MassActionLaw)
+    assert law.rate_constant == 2.0
+    assert dict(law.exponents) == {a: 2.0, b: 1.0}
+    assert law(0.0, {"A": 3.0, "B": 0.5}) == 9.0
+
+
+def test_mass_action_law_rejects_negative_rate_constant() -> None:
+    with pytest.raises(ValueError):
+        MassActionLaw(-1.0, {Species("A"): 1.0})
+
+
+def test_net_change_is_cached_and_copied() -> None:
+    a = Species("A")
+    b = Species("B")
+    reaction = Reaction(
+        reactants={a: 2.0}, products={a: 1.0, b: 1.0}, rate_law=mass_action(1.0, {a: 2.0})
+    )
+
+    delta = reaction.net_change()
+    delta[a] = 10.0
+
+    assert reaction.net_change() == {a: -1.0, b: 1.0}
+
+
+def test_compiled_rate_laws_read_indexed_arrays() -> None:
+    a = Species("A")
+    b = Species("B")
+    name_to_idx = {"A": 0, "B": 1}
+    x = np.array([3.0, 0.5])
+
+    mass_action_law = mass_action(2.0, {a: 2.0, b: 1.0}).compile(name_to_idx)
+    generic_law = RateLaw(lambda _t, c: c["A"] - c["B"]).compile(name_to_idx)
+
+    assert mass_action_law(0.0, x) == 9.0
+    assert generic_law(0.0, x) == 2.5
+
+
+def test_species_names_are_interned() -> None:
+    first = Species("".join(["Na", "Cl"]))
+    second = Species("NaCl")
+
+    assert first == second
+    assert first.name is second.name
+    assert not hasattr(first, "__dict__")
+
+
+def test_unsafe_new_matches_validated_reaction() -> None:
+    a = Species("A")
+    b = Species("B")
+    law = mass_action(1.0, {a: 1.0})
+
+    checked = Reaction(reactants={a: 1.0}, products={b: 2.0}, rate_law=law)
+    unchecked = Reaction._unsafe_new({a: 1.0}, {b: 2.0}, law)
+
+    assert unchecked == checked
+    assert unchecked.net_change() == {a: -1.0, b: 2.0}
+    # Validation is skipped entirely, so invalid input is the caller's responsibility.
+    assert Reaction._unsafe_new({}, {b: 1.0}, law).reactants == {}
+
+
+def test_species_accepts_str_subclass_names() -> None:
+    species = Species(np.str_("A"))
+
+    assert species == Species("A")
+    assert type(species.name) is str
+
+
+def test_mass_action_laws_are_hashable_with_identity_equality() -> None:
+    a = Species("A")
+    first = mass_action(1.0, {a: 1.0})
+    second = mass_action(1.0, {a: 1.0})
+
+    assert hash(first) == hash(first)
+    assert first != second
+    assert len({first, second}) == 2
+
+
+def test_mass_action_law_freezes_exponents() -> None:
+    a = Species("A")
+    exponents = {a: 1.0}
+    law = MassActionLaw(1.0, exponents)
+
+    exponents[a] = 2.0
+
+    assert dict(law.exponents) == {a: 1.0}
+    assert law(0.0, {"A": 3.0}) == 3.0
+    with pytest.raises(TypeError):
+        law.exponents[a] = 2.0  # type: ignore[index]
+
+
+def test_species_rejects_non_string_names() -> None:
+    with pytest.raises(TypeError):
+        Species(5)  # type: ignore[arg-type]
@@ -1,19 +1,31 @@
-from crnstudio import DeterministicSimulator, Reaction, Species, mass_action
+import sys
+from typing import Mapping
+
+import numpy as np
+import pytest
+
+from crnstudio import (
+    AdaptiveDP45Simulator,
+    DeterministicSimulator,
+    ImplicitSimulator,
+    RateLaw,
+    Reaction,
+    Species,
+    mass_action,
+)
 
 
 def test_mass_conservation() -> None:
     a = Species("A")
     b = Species("B")
 
-    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 2.0}))
 
     simulator = DeterministicSimulator([a, b], [reaction])
-    snapshots = simulator.simulate(
-        t_span=[0.0, 5.0], initial_conditions={"A": 1.0, "B": 0.0}, dt=0.01
-    )
+    result = simulator.simulate(t_span=[0.0, 5.0], initial_conditions={"A": 1.0, "B": 0.0}, dt=0.01)
 
-    totals = [state["A"] + state["B"] for state in snapshots]
-    assert max(abs(total - 1.0) for total in totals) < 1e-3
+    totals = result.values.sum(axis=1)
+    assert np.max(np.abs(totals - 1.0)) < 1e-3
 
 
 def test_reversible_reaction_equilibrium() -> None:
@@ -21,13 +33,516 @@ def test_reversible_reaction_equilibrium() -> None:
     b = Species("B")
 
     forward = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
-    reverse = Reaction(reactants={b: 1.0}, products={a: 1.0}, rate_law=mass_action(0.5, {b: 1.0}))
+    # A generic reverse law keeps the network off the exact linear path, so RK4 runs.
+    reverse = Reaction(
+        reactants={b: 1.0}, products={a: 1.0}, rate_law=RateLaw(lambda _t, c: 0.5 * c["B"])
+    )
 
     simulator = DeterministicSimulator([a, b], [forward, reverse])
-    snapshots = simulator.simulate(
+    result = simulator.simulate(
         t_span=[0.0, 20.0], initial_conditions={"A": 1.0, "B": 0.0}, dt=0.01
     )
 
-    final_state = snapshots[-1]
-    ratio = final_state["B"] / final_state["A"]
+    final_a, final_b = result.values[-1]
+    ratio = final_b / final_a
     assert 1.8 < ratio < 2.2  # Expect roughly 2:1 at equilibrium
+
+
+def test_derivative_matches_stoichiometry() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    reaction = Reaction(reactants={a: 2.0}, products={b: 1.0}, rate_law=mass_action(3.0, {a: 2.0}))
+
+    simulator = DeterministicSimulator([a, b], [reaction])
+    changes = simulator.derivative(0.0, np.array([2.0, 0.0]))
+
+    assert changes.tolist() == [-24.0, 12.0]
+
+
+def test_unknown_species_rejected() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
+
+    with pytest.raises(ValueError):
+        DeterministicSimulator([a], [reaction])
+
+
+def test_duplicate_species_names_rejected() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
+
+    with pytest.raises(ValueError):
+        DeterministicSimulator([a, Species("A"), b], [reaction])
+
+
+def test_mixed_rate_laws() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    decay = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(2.0, {a: 1.0}))
+    inflow = Reaction(
+        reactants={b: 1.0}, products={a: 1.0}, rate_law=RateLaw(lambda _t, c: 0.5 * c["B"])
+    )
+
+    simulator = DeterministicSimulator([a, b], [decay, inflow])
+    changes = simulator.derivative(0.0, np.array([1.0, 2.0]))
+
+    assert changes.tolist() == [-1.0, 1.0]
+
+
+def test_generic_rate_law_integration_matches_analytic_decay() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    reaction = Reaction(
+        reactants={a: 1.0}, products={b: 1.0}, rate_law=RateLaw(lambda _t, c: c["A"])
+    )
+
+    simulator = DeterministicSimulator([a, b], [reaction])
+    result = simulator.simulate(t_span=[0.0, 1.0], initial_conditions={"A": 1.0, "B": 0.0}, dt=0.01)
+
+    assert result.values.shape == (101, 2)
+    assert abs(result.values[-1, 0] - np.exp(-1.0)) < 1e-8
+
+
+def test_sparse_chain_network() -> None:
+    chain = [Species(f"X{i}") for i in range(40)]
+    reactions = [
+        Reaction(reactants={src: 1.0}, products={dst: 1.0}, rate_law=mass_action(1.0, {src: 1.0}))
+        for src, dst in zip(chain[:-1], chain[1:], strict=True)
+    ]
+
+    simulator = DeterministicSimulator(chain, reactions)
+    x = np.linspace(1.0, 2.0, len(chain))
+    expected = np.concatenate(([-x[0]], x[:-2] - x[1:-1], [x[-2]]))
+    np.testing.assert_allclose(simulator.derivative(0.0, x), expected)
+
+    initial = {sp.name: 0.0 for sp in chain}
+    initial["X0"] = 1.0
+    result = simulator.simulate(t_span=[0.0, 2.0], initial_conditions=initial, dt=0.01)
+    assert abs(result.values[-1].sum() - 1.0) < 1e-9
+
+
+def test_sparse_nonlinear_network_is_stepped() -> None:
+    chain = [Species(f"X{i}") for i in range(40)]
+    reactions = [
+        Reaction(
+            reactants={src: 1.0, dst: 1.0},
+            products={dst: 2.0},
+            rate_law=mass_action(1.0, {src: 1.0, dst: 1.0}),
+        )
+        for src, dst in zip(chain[:-1], chain[1:], strict=True)
+    ]
+    initial = {sp.name: 1.0 / len(chain) for sp in chain}
+
+    simulator = DeterministicSimulator(chain, reactions)
+    assert simulator._sparse and simulator._K is None
+    result = simulator.simulate([0.0, 20.0], initial, dt=0.01, snapshot_every=100)
+    reference = ImplicitSimulator(chain, reactions, rtol=1e-10, atol=1e-12).simulate(
+        [0.0, 20.0], initial, dt=0.01, snapshot_every=100
+    )
+
+    np.testing.assert_allclose(result.values, reference.values, atol=1e-7)
+    np.testing.assert_allclose(result.values.sum(axis=1), 1.0, atol=1e-12)
+
+
+def test_sparse_linear_network_is_solved_exactly_only_for_sparse_sampling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    chain = [Species(f"X{i}") for i in range(40)]
+    reactions = [
+        Reaction(reactants={src: 1.0}, products={dst: 1.0}, rate_law=mass_action(1.0, {src: 1.0}))
+        for src, dst in zip(chain[:-1], chain[1:], strict=True)
+    ]
+    initial = {sp.name: 0.0 for sp in chain}
+    initial["X0"] = 1.0
+    simulator = DeterministicSimulator(chain, reactions)
+    assert simulator._sparse and simulator._K is not None
+
+    stepped = simulator.simulate([0.0, 9.0], initial, dt=0.01)
+    monkeypatch.setattr(simulator, "_integrate", None)
+    exact = simulator.simulate([0.0, 9.0], initial, dt=0.01, snapshot_every=400)
+
+    np.testing.assert_allclose(exact.times, [0.0, 4.0, 8.0, 9.0])
+    # X0 decays as exp(-t) and X1 as t * exp(-t) along the chain.
+    np.testing.assert_allclose(exact.values[:, 0], np.exp(-exact.times), rtol=1e-10)
+    np.testing.assert_allclose(exact.values[:, 1], exact.times * np.exp(-exact.times), rtol=1e-9)
+    np.testing.assert_allclose(exact.values, stepped.values[[0, 400, 800, 900]], atol=1e-9)
+
+    x0s = np.array([exact.values[0], exact.values[1]])
+    batch = simulator.simulate_batch([0.0, 9.0], x0s, dt=0.01, snapshot_every=400)
+    np.testing.assert_allclose(batch.values[:, 0], exact.values, atol=1e-12)
+
+
+def test_rate_evaluation_paths_agree_for_mixed_exponents() -> None:
+    a = Species("A")
+    b = Species("B")
+    c = Species("C")
+
+    laws = [
+        mass_action(1.5, {a: 1.0, b: 2.0}),
+        mass_action(0.5, {c: 3.0}),
+        mass_action(2.0, {a: 0.5, c: 4.0}),
+    ]
+    reactions = [Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=law) for law in laws]
+    simulator = DeterministicSimulator([a, b, c], reactions)
+    x = np.array([1.3, 0.7, 2.1])
+    concentrations = {"A": 1.3, "B": 0.7, "C": 2.1}
+
+    expected = [law(0.0, concentrations) for law in laws]
+    compiled = [law.compile({"A": 0, "B": 1, "C": 2})(0.0, x) for law in laws]
+
+    np.testing.assert_allclose(compiled, expected)
+    np.testing.assert_allclose(
+        simulator.derivative(0.0, x), [-sum(expected), sum(expected), 0.0], rtol=1e-12
+    )
+
+
+def test_adaptive_dp45_matches_analytic_solution() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    forward = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
+    # A generic law keeps the network off the exact linear path so the stepper is exercised.
+    reverse = Reaction(
+        reactants={b: 1.0}, products={a: 1.0}, rate_law=RateLaw(lambda _t, c: 0.5 * c["B"])
+    )
+
+    simulator = AdaptiveDP45Simulator([a, b], [forward, reverse], rtol=1e-8, atol=1e-10)
+    result = simulator.simulate(t_span=[0.0, 5.0], initial_conditions={"A": 1.0, "B": 0.0}, dt=0.01)
+
+    np.testing.assert_allclose(result.times, np.linspace(0.0, 5.0, 501))
+    expected_a = 1.0 / 3.0 + 2.0 / 3.0 * np.exp(-1.5 * result.times)
+    np.testing.assert_allclose(result.values[:, 0], expected_a, atol=1e-7)
+    np.testing.assert_allclose(result.values.sum(axis=1), 1.0, atol=1e-12)
+
+
+def test_first_order_network_is_solved_exactly(monkeypatch: pytest.MonkeyPatch) -> None:
+    a = Species("A")
+    b = Species("B")
+
+    forward = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
+    reverse = Reaction(reactants={b: 1.0}, products={a: 1.0}, rate_law=mass_action(0.5, {b: 1.0}))
+    simulator = DeterministicSimulator([a, b], [forward, reverse])
+    monkeypatch.setattr(simulator, "_integrate", None)
+
+    result = simulator.simulate([0.0, 5.0], {"A": 1.0, "B": 0.0}, dt=0.5, snapshot_every=3)
+
+    np.testing.assert_allclose(result.times, [0.0, 1.5, 3.0, 4.5, 5.0])
+    expected_a = 1.0 / 3.0 + 2.0 / 3.0 * np.exp(-1.5 * result.times)
+    np.testing.assert_allclose(result.values[:, 0], expected_a, rtol=1e-12)
+    np.testing.assert_allclose(result.values.sum(axis=1), 1.0, rtol=1e-12)
+
+
+def test_adaptive_dp45_uses_fewer_rate_evaluations_than_rk4() -> None:
+    a = Species("A")
+    b = Species("B")
+    calls = {"count": 0}
+
+    def decay(_t: float, c: Mapping[str, float]) -> float:
+        calls["count"] += 1
+        return c["A"]
+
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=RateLaw(decay))
+    initial = {"A": 1.0, "B": 0.0}
+
+    DeterministicSimulator([a, b], [reaction]).simulate([0.0, 5.0], initial, dt=0.01)
+    rk4_calls = calls["count"]
+    calls["count"] = 0
+    result = AdaptiveDP45Simulator([a, b], [reaction]).simulate([0.0, 5.0], initial, dt=0.01)
+
+    assert calls["count"] * 10 < rk4_calls
+    assert abs(result.values[-1, 0] - np.exp(-5.0)) < 1e-6
+
+
+@pytest.mark.parametrize(
+    "simulator_cls", [DeterministicSimulator, AdaptiveDP45Simulator, ImplicitSimulator]
+)
+def test_batch_simulation_matches_individual_runs(
+    simulator_cls: type[DeterministicSimulator],
+) -> None:
+    a = Species("A")
+    b = Species("B")
+    c = Species("C")
+
+    reactions = [
+        Reaction(
+            reactants={a: 1.0, b: 1.0},
+            products={c: 1.0},
+            rate_law=mass_action(2.0, {a: 1.0, b: 1.0}),
+        ),
+        Reaction(
+            reactants={c: 1.0}, products={a: 1.0}, rate_law=RateLaw(lambda _t, x: 0.3 * x["C"])
+        ),
+    ]
+    simulator = simulator_cls([a, b, c], reactions)
+    x0s = np.array([[1.0, 0.5, 0.0], [0.2, 2.0, 1.0], [0.0, 0.0, 3.0]])
+
+    batch = simulator.simulate_batch([0.0, 2.0], x0s, dt=0.05)
+
+    assert batch.values.shape == (41, 3, 3)
+    assert batch.names == ["A", "B", "C"]
+    for b_idx, x0 in enumerate(x0s):
+        single = simulator.simulate([0.0, 2.0], dict(zip("ABC", x0, strict=True)), dt=0.05)
+        np.testing.assert_allclose(batch.times, single.times)
+        np.testing.assert_allclose(batch.values[:, b_idx], single.values, atol=1e-6)
+    with pytest.raises(ValueError):
+        batch.as_dicts()
+
+
+def test_batch_simulation_rejects_bad_shape() -> None:
+    a = Species("A")
+    simulator = DeterministicSimulator([a], [])
+
+    with pytest.raises(ValueError):
+        simulator.simulate_batch([0.0, 1.0], np.ones((2, 3)), dt=0.1)
+
+
+def test_device_batch_kernel_matches_host_batch() -> None:
+    a = Species("A")
+    b = Species("B")
+    c = Species("C")
+
+    reactions = [
+        Reaction(
+            reactants={a: 1.0, b: 1.0},
+            products={c: 1.0},
+            rate_law=mass_action(2.0, {a: 1.0, b: 1.0}),
+        ),
+        Reaction(reactants={c: 1.0}, products={a: 1.0}, rate_law=mass_action(0.3, {c: 1.0})),
+        Reaction(reactants={b: 2.0}, products={c: 1.0}, rate_law=mass_action(0.1, {b: 2.0})),
+    ]
+    simulator = DeterministicSimulator([a, b, c], reactions)
+    x0s = np.array([[1.0, 0.5, 0.0], [0.2, 2.0, 1.0]])
+
+    expected = simulator.simulate_batch([0.0, 1.0], x0s, dt=0.05)
+    # The GPU path is written against an array module; NumPy stands in for CuPy here.
+    result = simulator._simulate_mass_action_batch(
+        np, simulator._S, [0.0, 1.0], x0s, dt=0.05, snapshot_every=3
+    )
+
+    np.testing.assert_allclose(result.times, [0.0, 0.15, 0.3, 0.45, 0.6, 0.75, 0.9, 1.0])
+    assert result.names == ["A", "B", "C"]
+    np.testing.assert_allclose(
+        result.values, expected.values[[0, 3, 6, 9, 12, 15, 18, 20]], rtol=1e-12
+    )
+
+
+def test_gpu_batch_requires_cupy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "cupy", None)
+    simulator = DeterministicSimulator([Species("A")], [])
+
+    with pytest.raises(ImportError):
+        simulator.simulate_batch_gpu([0.0, 1.0], np.ones((4, 1)), dt=0.1)
+
+
+@pytest.mark.parametrize("simulator_cls", [AdaptiveDP45Simulator, ImplicitSimulator])
+def test_gpu_batch_rejects_simulators_with_their_own_integrator(
+    simulator_cls: type[DeterministicSimulator],
+) -> None:
+    simulator = simulator_cls([Species("A")], [])
+
+    with pytest.raises(NotImplementedError):
+        simulator.simulate_batch_gpu([0.0, 1.0], np.ones((4, 1)), dt=0.1)
+
+
+def test_simulation_result_as_dicts() -> None:
+    a = Species("A")
+    b = Species("B")
+
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 2.0}))
+    result = DeterministicSimulator([a, b], [reaction]).simulate(
+        t_span=[0.0, 1.0], initial_conditions={"A": 1.0, "B": 0.0}, dt=0.25
+    )
+
+    snapshots = result.as_dicts()
+
+    assert result.names == ["A", "B"]
+    np.testing.assert_allclose(result.times, [0.0, 0.25, 0.5, 0.75, 1.0])
+    assert snapshots[0] == {"A": 1.0, "B": 0.0}
+    assert snapshots[-1] == {"A": result.values[-1, 0], "B": result.values[-1, 1]}
+
+
+@pytest.mark.parametrize(
+    "simulator_cls", [DeterministicSimulator, AdaptiveDP45Simulator, ImplicitSimulator]
+)
+def test_snapshot_every_subsamples_full_trajectory(
+    simulator_cls: type[DeterministicSimulator],
+) -> None:
+    a = Species("A")
+    b = Species("B")
+
+    # Second order keeps the network off the exact linear path, so the integrator runs.
+    reaction = Reaction(reactants={a: 2.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 2.0}))
+    simulator = simulator_cls([a, b], [reaction])
+    initial = {"A": 1.0, "B": 0.0}
+
+    full = simulator.simulate([0.0, 1.0], initial, dt=0.01)
+    sparse = simulator.simulate([0.0, 1.0], initial, dt=0.01, snapshot_every=30)
+
+    rows = [0, 30, 60, 90, 100]
+    np.testing.assert_allclose(sparse.times, full.times[rows])
+    np.testing.assert_allclose(sparse.values, full.values[rows], rtol=1e-12)
+    np.testing.assert_allclose(sparse.values[:, 0], 1.0 / (1.0 + 2.0 * sparse.times), atol=1e-5)
+
+    batch = simulator.simulate_batch([0.0, 1.0], [[1.0, 0.0]], dt=0.01, snapshot_every=30)
+    np.testing.assert_allclose(batch.times, sparse.times)
+    np.testing.assert_allclose(batch.values[:, 0], sparse.values, rtol=1e-9)
+
+    with pytest.raises(ValueError):
+        simulator.simulate([0.0, 1.0], initial, dt=0.01, snapshot_every=0)
+
+
+def test_compiled_network_is_reused_until_reactions_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a = Species("A")
+    b = Species("B")
+    decay = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
+    simulator = DeterministicSimulator([a, b], [decay])
+
+    calls = []
+    compile_network = simulator._compile
+
+    def counting_compile() -> None:
+        calls.append(1)
+        compile_network()
+
+    monkeypatch.setattr(simulator, "_compile", counting_compile)
+
+    ic = {"A": 1.0, "B": 0.0}
+    simulator.simulate(t_span=[0.0, 1.0], initial_conditions=ic, dt=0.1)
+    simulator.simulate(t_span=[0.0, 1.0], initial_conditions=ic, dt=0.1)
+    assert calls == []
+
+    simulator.reactions.append(
+        Reaction(reactants={b: 1.0}, products={a: 1.0}, rate_law=mass_action(1.0, {b: 1.0}))
+    )
+    result = simulator.simulate(t_span=[0.0, 20.0], initial_conditions=ic, dt=0.01)
+    assert calls == [1]
+    np.testing.assert_allclose(result.values[-1], [0.5, 0.5], atol=1e-6)
+
+
+def test_implicit_simulator_solves_stiff_robertson_network() -> None:
+    a = Species("A")
+    b = Species("B")
+    c = Species("C")
+
+    reactions = [
+        Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(0.04, {a: 1.0})),
+        Reaction(
+            reactants={b: 2.0}, products={b: 1.0, c: 1.0}, rate_law=mass_action(3e7, {b: 2.0})
+        ),
+        Reaction(
+            reactants={b: 1.0, c: 1.0},
+            products={a: 1.0, c: 1.0},
+            rate_law=mass_action(1e4, {b: 1.0, c: 1.0}),
+        ),
+    ]
+    simulator = ImplicitSimulator([a, b, c], reactions, rtol=1e-8, atol=1e-12)
+
+    result = simulator.simulate([0.0, 40.0], {"A": 1.0, "B": 0.0, "C": 0.0}, dt=1.0)
+
+    assert result.values.shape == (41, 3)
+    np.testing.assert_allclose(result.values[-1], [0.7158271, 9.185535e-6, 0.2841637], rtol=1e-5)
+    np.testing.assert_allclose(result.values.sum(axis=1), 1.0, atol=1e-10)
+
+
+def test_implicit_jacobian_matches_finite_differences() -> None:
+    a = Species("A")
+    b = Species("B")
+    c = Species("C")
+
+    laws = [
+        mass_action(1.5, {a: 1.0, b: 2.0}),
+        mass_action(0.5, {c: 3.0}),
+        mass_action(2.0, {a: 0.5, c: 1.0}),
+    ]
+    reactions = [Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=law) for law in laws]
+    simulator = ImplicitSimulator([a, b, c], reactions)
+    x = np.array([1.3, 0.7, 2.1])
+
+    eps = 1e-6
+    expected = np.column_stack(
+        [
+            (simulator.derivative(0.0, x + eps * e) - simulator.derivative(0.0, x - eps * e))
+            / (2 * eps)
+            for e in np.eye(3)
+        ]
+    )
+    np.testing.assert_allclose(simulator.jacobian(0.0, x).toarray(), expected, rtol=1e-6)
+    # Integer exponents keep the Jacobian finite at zero concentrations.
+    assert np.all(np.isfinite(simulator.jacobian(0.0, np.array([1.0, 0.0, 0.0])).toarray()))
+
+    mixed = ImplicitSimulator([a, b], [Reaction({a: 1.0}, {b: 1.0}, RateLaw(lambda _t, x: x["A"]))])
+    with pytest.raises(ValueError):
+        mixed.jacobian(0.0, np.array([1.0, 0.0]))
+
+
+def test_public_derivative_and_jacobian_follow_network_changes() -> None:
+    a = Species("A")
+    b = Species("B")
+    decay = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 1.0}))
+    simulator = ImplicitSimulator([a, b], [decay])
+    x = np.array([1.0, 0.0])
+
+    assert simulator.derivative(0.0, x).tolist() == [-1.0, 1.0]
+    simulator.reactions.clear()
+
+    assert simulator.derivative(0.0, x).tolist() == [0.0, 0.0]
+    assert simulator.jacobian(0.0, x).nnz == 0
+
+
+def test_implicit_simulator_handles_fractional_orders_at_zero() -> None:
+    a = Species("A")
+    b = Species("B")
+    reactions = [
+        Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 0.5})),
+        Reaction(reactants={b: 1.0}, products={a: 1.0}, rate_law=mass_action(1.0, {b: 1.0})),
+    ]
+    initial = {"A": 0.0, "B": 1.0}
+
+    result = ImplicitSimulator([a, b], reactions, rtol=1e-8, atol=1e-10).simulate(
+        [0.0, 5.0], initial, dt=0.5
+    )
+    reference = DeterministicSimulator([a, b], reactions).simulate(
+        [0.0, 5.0], initial, dt=0.001, snapshot_every=500
+    )
+
+    np.testing.assert_allclose(result.values, reference.values, atol=1e-5)
+
+
+def test_implicit_simulator_returns_initial_state_when_dt_exceeds_span() -> None:
+    a = Species("A")
+    b = Species("B")
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 2.0}))
+
+    result = ImplicitSimulator([a, b], [reaction]).simulate(
+        [0.0, 1.0], {"A": 1.0, "B": 0.0}, dt=2.0
+    )
+
+    np.testing.assert_allclose(result.times, [0.0])
+    np.testing.assert_allclose(result.values, [[1.0, 0.0]])
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_half_order_decay_runs_to_zero() -> None:
+    a = Species("A")
+    b = Species("B")
+    reaction = Reaction(reactants={a: 1.0}, products={b: 1.0}, rate_law=mass_action(1.0, {a: 0.5}))
+    simulator = DeterministicSimulator([a, b], [reaction])
+
+    result = simulator.simulate([0.0, 3.0], {"A": 1.0, "B": 0.0}, dt=0.01)
+
+    # sqrt(A) = 1 - t / 2 until A is exhausted at t = 2. Past that, RK4 overshoots to a
+    # negative A and the rates follow NumPy (nan) rather than raising.
+    early = result.times <= 1.5
+    expected = (1.0 - result.times[early] / 2) ** 2
+    np.testing.assert_allclose(result.values[early, 0], expected, atol=1e-8)
+    assert result.values.shape == (301, 2)
+    assert np.isnan(simulator.derivative(0.0, np.array([-1e-9, 1.0]))).all()